@@ -103,6 +103,8 @@ export default function DiagnosticPage() {
       preferredFont: profile?.preferredFont,
       animationIntensity: profile?.animationIntensity,
       focusMode: profile?.focusMode,
+      firstSessionDate: profile?.firstSessionDate,
+      learnerId: profile?.learnerId,
     });
   };
 
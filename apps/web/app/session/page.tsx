@@ -25,6 +25,17 @@ type WarmupGame = 'stroop' | 'number-sequence' | 'direction-reaction' | 'color-m
 
 const WARMUP_GAMES: WarmupGame[] = ['stroop', 'number-sequence', 'direction-reaction', 'color-match'];
 
+// 프로필과 완료한 세션 수로 스케줄러 생성 (세션 수로 사전 생성 덱을 순환 선택)
+async function createScheduler(): Promise<PersonalizedScheduler> {
+  const profile = await db.userProfile.get('default');
+  return new PersonalizedScheduler({
+    gradeBand: profile?.gradeBand,
+    weakTags: profile?.weakTags,
+    firstSessionDate: profile?.firstSessionDate,
+    sessionIndex: await db.sessionLogs.count(),
+  });
+}
+
 export default function SessionPage() {
   const [sessionFlow] = useState(() => new SessionFlowManager());
   const [currentPhase, setCurrentPhase] = useState<SessionPhase>('warmup');
@@ -50,13 +61,7 @@ export default function SessionPage() {
 
     // 스케줄러 초기화 (UserProfile에서 firstSessionDate 가져오기)
     const initializeScheduler = async () => {
-      const profile = await db.userProfile.get('default');
-      const schedulerInstance = new PersonalizedScheduler({
-        gradeBand: profile?.gradeBand,
-        weakTags: profile?.weakTags,
-        firstSessionDate: profile?.firstSessionDate,
-      });
-      setScheduler(schedulerInstance);
+      setScheduler(await createScheduler());
     };
     
     initializeScheduler();
@@ -90,28 +95,11 @@ export default function SessionPage() {
       setRoundStartTimes(prev => ({ ...prev, math: Date.now() }));
     } else if (phase === 'round-b') {
       setRoundStartTimes(prev => ({ ...prev, english: Date.now() }));
-    } else if (phase === 'round-c') {
-      // 과학 또는 사회 중 하나
-      const profile = await db.userProfile.get('default');
-      const schedulerInstance = scheduler || new PersonalizedScheduler({
-        gradeBand: profile?.gradeBand,
-        weakTags: profile?.weakTags,
-        firstSessionDate: profile?.firstSessionDate,
-      });
-      const items = await schedulerInstance.selectItemsForRound(10);
-      const subject = items[0]?.subject || 'science';
-      setRoundStartTimes(prev => ({ ...prev, [subject]: Date.now() }));
     }
 
     // scheduler가 아직 준비되지 않았으면 초기화
     if (!scheduler) {
-      const profile = await db.userProfile.get('default');
-      const schedulerInstance = new PersonalizedScheduler({
-        gradeBand: profile?.gradeBand,
-        weakTags: profile?.weakTags,
-        firstSessionDate: profile?.firstSessionDate,
-      });
-      setScheduler(schedulerInstance);
+      setScheduler(await createScheduler());
     }
     
     // 영어 게임 선택 (round-b 페이즈일 때만)
@@ -123,15 +111,13 @@ export default function SessionPage() {
     
     // 항목 선택 (비동기로 처리)
     if (phase === 'round-a' || phase === 'round-b' || phase === 'round-c') {
-      const currentScheduler = scheduler || await (async () => {
-        const profile = await db.userProfile.get('default');
-        return new PersonalizedScheduler({
-          gradeBand: profile?.gradeBand,
-          weakTags: profile?.weakTags,
-          firstSessionDate: profile?.firstSessionDate,
-        });
-      })();
+      const currentScheduler = scheduler || await createScheduler();
       const items = await currentScheduler.selectItemsForRound(10);
+      if (phase === 'round-c') {
+        // 과학 또는 사회 중 하나 — 실제로 출제한 항목의 과목으로 기록
+        const subject = items[0]?.subject || 'science';
+        setRoundStartTimes(prev => ({ ...prev, [subject]: Date.now() }));
+      }
       setRoundItems(items);
     } else if (phase === 'recall-boss') {
       const profile = await db.userProfile.get('default');
@@ -216,6 +202,11 @@ export default function SessionPage() {
       items: results.map((r) => r.itemId),
       correct,
       latencyAvgMs: avgLatency,
+      responses: results.map((r) => ({
+        itemId: r.itemId,
+        correct: r.correct,
+        latencyMs: r.latencyMs,
+      })),
     };
 
     setRoundResults((prev) => [...prev, roundResult]);
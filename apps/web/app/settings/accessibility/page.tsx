@@ -25,7 +25,9 @@ export default function AccessibilityPage() {
   };
 
   const handleSave = async () => {
+    const existing = await db.userProfile.get('default');
     const profile: UserProfile = {
+      ...existing,
       id: 'default',
       preferredFont: font,
       animationIntensity,
@@ -10,6 +10,16 @@ export class DataManager {
    * 모든 데이터를 JSON으로 내보내기
    */
   async exportData(): Promise<string> {
+    // 여러 번 내보내도 같은 학습자로 집계되도록 고정 식별자 부여 (tools/builder/logs.py)
+    const profile = await db.userProfile.get('default');
+    if (!profile?.learnerId) {
+      await db.userProfile.put({
+        id: 'default',
+        ...profile,
+        learnerId: crypto.randomUUID(),
+      });
+    }
+
     const data = {
       learningItems: await db.learningItems.toArray(),
       reviewStates: await db.reviewStates.toArray(),
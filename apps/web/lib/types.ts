@@ -46,11 +46,18 @@ export interface ReviewState {
   lastLatencyMs?: number;
 }
 
+export interface ItemResponse {
+  itemId: string;
+  correct: boolean;
+  latencyMs: number;
+}
+
 export interface RoundResult {
   subject: Subject;
   items: string[];
   correct: number;
   latencyAvgMs: number;
+  responses?: ItemResponse[]; // 문항별 응답 (난이도 보정용, 이전 로그에는 없음)
 }
 
 export interface SessionLog {
@@ -68,6 +75,7 @@ export interface UserProfile {
   animationIntensity?: number; // 0-1
   focusMode?: boolean;
   firstSessionDate?: number; // 첫 세션 시작 날짜 (timestamp)
+  learnerId?: string; // 내보내기 로그 집계용 학습자 식별자 (첫 내보내기 때 생성)
 }
 
 // 세션 관련 타입
@@ -1,7 +1,7 @@
 import { z } from 'zod';
 import { load } from 'js-yaml';
 import { learningItemSchema, type LearningItemSchema } from '@/content/schema/learning-item';
-import type { LearningItem } from '@/lib/types';
+import type { LearningItem, GradeBand, Subject } from '@/lib/types';
 
 /**
  * YAML 파일을 로드하고 검증합니다.
@@ -89,3 +89,50 @@ export async function loadAllLearningItems(): Promise<LearningItem[]> {
   }
 }
 
+/**
+ * 세션 덱의 라운드 하나 (한 과목 문항으로 꽉 찬 라운드)
+ */
+export interface SessionDeckRound {
+  subject: Subject;
+  items: LearningItem[];
+}
+
+/**
+ * 사전 생성된 세션 덱 하나를 로드합니다 (tools/builder/build_decks.py).
+ * 전체 은행 대신 작은 파일 하나만 받으므로 첫 세션을 바로 시작할 수 있습니다.
+ * sessionIndex로 순환 풀에서 덱을 고릅니다.
+ */
+export async function loadSessionDeck(
+  gradeBand: GradeBand,
+  sessionIndex: number
+): Promise<SessionDeckRound[]> {
+  try {
+    const basePath = typeof window !== 'undefined'
+      ? (process.env.NEXT_PUBLIC_BASE_PATH || '/jihoo')
+      : '';
+
+    const manifestResponse = await fetch(`${basePath}/content/decks/index.json`);
+    if (!manifestResponse.ok) {
+      throw new Error(`Failed to fetch decks/index.json: ${manifestResponse.status}`);
+    }
+
+    const manifest = await manifestResponse.json();
+    const files: string[] = manifest.gradeBands?.[gradeBand] || [];
+    if (files.length === 0) return [];
+
+    const file = files[sessionIndex % files.length];
+    const response = await fetch(`${basePath}/content/${file}`);
+    if (!response.ok) {
+      throw new Error(`Failed to fetch ${file}: ${response.status}`);
+    }
+
+    const deck = await response.json();
+    return (deck.rounds || []).map((round: { subject: Subject; items: LearningItem[] }) => ({
+      subject: round.subject,
+      items: round.items,
+    }));
+  } catch (error) {
+    console.error('Failed to load session deck:', error);
+    return [];
+  }
+}
@@ -1,7 +1,7 @@
 import type { Subject, GradeBand, LearningItem } from '@/lib/types';
 import { db } from '@/lib/db';
 import { getDueItems } from '@/modules/fsrs/engine';
-import { loadAllLearningItems } from '@/modules/content/loader';
+import { loadAllLearningItems, loadSessionDeck, type SessionDeckRound } from '@/modules/content/loader';
 
 // 콘텐츠 캐시
 let contentCache: LearningItem[] | null = null;
@@ -20,6 +20,24 @@ async function getContentCache(): Promise<LearningItem[]> {
   return cacheLoadPromise;
 }
 
+// 사전 생성 세션 덱 캐시 (학년군:세션 순번 → 라운드 목록과 다음에 낼 라운드 위치)
+interface SessionDeck {
+  rounds: SessionDeckRound[];
+  next: number;
+}
+
+const deckCache = new Map<string, Promise<SessionDeck>>();
+
+function getSessionDeck(gradeBand: GradeBand, sessionIndex: number): Promise<SessionDeck> {
+  const key = `${gradeBand}:${sessionIndex}`;
+  let deck = deckCache.get(key);
+  if (!deck) {
+    deck = loadSessionDeck(gradeBand, sessionIndex).then(rounds => ({ rounds, next: 0 }));
+    deckCache.set(key, deck);
+  }
+  return deck;
+}
+
 export interface SubjectDistribution {
   math: number;      // 기본 40%
   english: number;   // 기본 30%
@@ -40,6 +58,7 @@ export interface SchedulerConfig {
   distribution?: SubjectDistribution;
   weaknessWeight?: number; // 약점 태그 비중 (0-1, 기본 0.6)
   firstSessionDate?: number; // 첫 세션 날짜 (timestamp, 시간 기반 가중치 계산용)
+  sessionIndex?: number; // 완료한 세션 수 (사전 생성 덱 선택용)
 }
 
 /**
@@ -139,6 +158,28 @@ export class PersonalizedScheduler {
         this.config.weaknessWeight!
       );
     }
+
+    // 워밍업 동안 덱을 미리 받아 둠
+    void this.getDeck();
+  }
+
+  /**
+   * 이번 세션의 사전 생성 덱을 가져옵니다. 학년군/세션 순번이 없거나 덱이 비면 null.
+   */
+  private async getDeck(): Promise<SessionDeck | null> {
+    const { gradeBand, sessionIndex } = this.config;
+    if (!gradeBand || sessionIndex === undefined) return null;
+    const deck = await getSessionDeck(gradeBand, sessionIndex);
+    return deck.rounds.length > 0 ? deck : null;
+  }
+
+  /**
+   * 덱에서 아직 내지 않은 다음 라운드를 꺼냅니다. 덱이 없거나 다 썼으면 null.
+   */
+  private async nextDeckRound(): Promise<SessionDeckRound | null> {
+    const deck = await this.getDeck();
+    if (!deck || deck.next >= deck.rounds.length) return null;
+    return deck.rounds[deck.next++];
   }
 
   /**
@@ -244,8 +285,16 @@ export class PersonalizedScheduler {
       }
     }
     
+    // 사전 생성 덱에 남은 라운드가 있으면 그 라운드의 과목과 문항을 사용 (전체 은행을 받지 않음)
+    const round = selected.length < count ? await this.nextDeckRound() : null;
+    if (round) {
+      const chosen = new Set(selected.map(item => item.id));
+      selected.push(...round.items.filter(item => !chosen.has(item.id)));
+    }
+    
+    // 덱이 없거나 다 썼으면(또는 라운드가 모자라면) 전체 은행에서 선택
     if (selected.length < count) {
-      const subject = this.selectNextSubject();
+      const subject = round?.subject ?? this.selectNextSubject();
       const additional = await this.selectItems(
         subject,
         count - selected.length
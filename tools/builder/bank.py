@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+문항 은행 로더
+apps/web/public/content 아래의 과목별 JSON 파일을 읽어오는 공용 헬퍼
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CONTENT_DIR = REPO_ROOT / "apps" / "web" / "public" / "content"
+DEFAULT_CALIBRATION_PATH = REPO_ROOT / "tools" / "calibration" / "difficulty.json"
+
+SUBJECTS = ["math", "english", "science", "social"]
+
+
+def iter_bank_files(content_dir: Path) -> Iterator[Path]:
+    """과목 디렉토리의 JSON 파일을 정렬된 순서로 나열"""
+    for subject in SUBJECTS:
+        subject_dir = content_dir / subject
+        if not subject_dir.is_dir():
+            continue
+        yield from sorted(subject_dir.glob("*.json"))
+
+
+def load_bank(content_dir: Path) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """(content_dir 기준 상대 경로, 문항 목록) 쌍의 목록 반환"""
+    bank = []
+    for path in iter_bank_files(content_dir):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        items = data if isinstance(data, list) else [data]
+        bank.append((path.relative_to(content_dir).as_posix(), items))
+    return bank
+
+
+def iter_item_spans(text: str) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+    """
+    은행 파일 텍스트에서 (문항, 시작 문자 위치, 끝 문자 위치)를 순서대로 나열
+    load_bank와 같이 최상위 배열과 단일 객체 파일을 모두 허용 (원본 서식은 건드리지 않음)
+    """
+    decoder = json.JSONDecoder()
+    pos = len(text) - len(text.lstrip())
+
+    if not text.startswith("[", pos):
+        item, end = decoder.raw_decode(text, pos)
+        yield item, pos, end
+        return
+
+    pos += 1
+    while True:
+        while text[pos] in " \t\r\n,":
+            pos += 1
+        if text[pos] == "]":
+            return
+        item, end = decoder.raw_decode(text, pos)
+        yield item, pos, end
+        pos = end
+
+
+def stem_text(item: Dict[str, Any]) -> str:
+    """stem payload에서 비교 가능한 텍스트 추출 (audio는 payload.text)"""
+    payload = item.get("stem", {}).get("payload")
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, dict):
+        return str(payload.get("text", ""))
+    return "" if payload is None else str(payload)
+
+
+def load_calibration(path: Path = DEFAULT_CALIBRATION_PATH) -> Dict[str, int]:
+    """보정된 난이도 테이블 로드 (id → difficulty). 파일이 없으면 빈 dict"""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        table = json.load(f)
+    return {item_id: entry["difficulty"] for item_id, entry in table.get("items", {}).items()}
+
+
+def apply_calibration(items: List[Dict[str, Any]], calibration: Dict[str, int]) -> int:
+    """문항의 추정 난이도를 보정값으로 교체하고, 교체한 개수 반환"""
+    applied = 0
+    for item in items:
+        difficulty = calibration.get(item.get("id"))
+        if difficulty is not None:
+            item["difficulty"] = difficulty
+            applied += 1
+    return applied
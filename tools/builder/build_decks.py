@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+세션 덱 사전 생성
+학년군별로 바로 플레이 가능한 세션 덱(라운드별 문항 id + 인라인 문항)을 순환 풀로 내보냄
+- 덱 = 라운드 3개, 라운드 = 한 과목 문항 10개 (스케줄러 selectItemsForRound(10)과 같은 단위)
+- 라운드 과목은 scheduler/personalized.ts의 DEFAULT_DISTRIBUTION 비율로 배정
+- 과목 안에서는 (영역, 난이도 구간) 층을 번갈아 뽑아 고르게 분포
+- 순환 풀에서 연속한 window개 덱 안에서는 같은 문항이 다시 나오지 않음
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+from bank import DEFAULT_CONTENT_DIR, load_bank
+
+# scheduler/personalized.ts DEFAULT_DISTRIBUTION과 동일하게 유지
+DISTRIBUTION = {"math": 0.4, "english": 0.3, "science": 0.15, "social": 0.15}
+
+# lib/types.ts GradeBand (스케줄러는 gradeBand를 정확히 일치시켜 필터링)
+GRADE_BANDS = ["ES12", "ES34", "ES56", "MS1", "MS23"]
+
+DIFFICULTY_BANDS = [(1, 3), (4, 6), (7, 10)]
+
+# 세션 = 라운드 3개 × selectItemsForRound(10)
+ROUNDS_PER_DECK = 3
+ROUND_SIZE = 10
+
+
+def difficulty_band(difficulty: float) -> int:
+    for i, (low, high) in enumerate(DIFFICULTY_BANDS):
+        if difficulty <= high:
+            return i
+    return len(DIFFICULTY_BANDS) - 1
+
+
+def subject_quotas(slots: int) -> Dict[str, int]:
+    """최대 잔여 방식으로 과목별 라운드 수 배분"""
+    raw = {s: slots * p for s, p in DISTRIBUTION.items()}
+    quotas = {s: int(v) for s, v in raw.items()}
+    by_remainder = sorted(DISTRIBUTION, key=lambda s: raw[s] - quotas[s], reverse=True)
+    for s in by_remainder[:slots - sum(quotas.values())]:
+        quotas[s] += 1
+    return quotas
+
+
+class StratifiedPool:
+    """한 과목의 문항을 (영역, 난이도 구간) 층으로 나눠 순환하며 꺼내는 풀"""
+
+    def __init__(self, items: List[Dict[str, Any]], rng: random.Random):
+        strata: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        for item in items:
+            key = (item["area"], difficulty_band(item.get("difficulty", 5)))
+            strata.setdefault(key, []).append(item)
+        self.strata = [strata[key] for key in sorted(strata)]
+        for stratum in self.strata:
+            rng.shuffle(stratum)
+        rng.shuffle(self.strata)
+        self.cursor = [0] * len(self.strata)
+        self.next_stratum = 0
+
+    def draw(self, count: int, usable) -> List[Dict[str, Any]]:
+        """층을 돌아가며 usable(item)을 만족하는 서로 다른 문항을 최대 count개 꺼냄"""
+        drawn, drawn_ids = [], set()
+        exhausted = set()
+        while len(drawn) < count and len(exhausted) < len(self.strata):
+            s = self.next_stratum
+            self.next_stratum = (s + 1) % len(self.strata)
+            if s in exhausted:
+                continue
+            stratum = self.strata[s]
+            for step in range(len(stratum)):
+                item = stratum[(self.cursor[s] + step) % len(stratum)]
+                if item["id"] not in drawn_ids and usable(item):
+                    drawn.append(item)
+                    drawn_ids.add(item["id"])
+                    self.cursor[s] = (self.cursor[s] + step + 1) % len(stratum)
+                    break
+            else:
+                exhausted.add(s)
+        return drawn
+
+
+def build_decks(
+    items: List[Dict[str, Any]],
+    grade_band: str,
+    deck_count: int,
+    window: int
+) -> Tuple[List[List[Tuple[str, List[Dict[str, Any]]]]], int]:
+    """
+    학년군 하나의 순환 덱 풀 생성 → (덱별 (과목, 문항) 라운드 목록, 다른 과목으로 바꾼 라운드 수)
+    라운드는 항상 ROUND_SIZE개를 채움 — 배정된 과목으로 못 채우면 비율이 큰 과목부터 대신 사용
+    """
+    rng = random.Random(f"deck-{grade_band}")
+    pools = {
+        subject: StratifiedPool([i for i in items if i["subject"] == subject], rng)
+        for subject in DISTRIBUTION
+    }
+    # 풀 전체의 라운드 슬롯에 과목 비율대로 과목을 배정한 뒤 섞음
+    slots = [
+        subject
+        for subject, quota in subject_quotas(deck_count * ROUNDS_PER_DECK).items()
+        for _ in range(quota)
+    ]
+    rng.shuffle(slots)
+    by_share = sorted(DISTRIBUTION, key=DISTRIBUTION.get, reverse=True)
+
+    used_in: Dict[str, List[int]] = {}
+    substituted = 0
+    decks = []
+
+    for d in range(deck_count):
+        chosen = set()
+
+        def usable(item: Dict[str, Any]) -> bool:
+            # 순환 풀이므로 마지막 덱과 첫 덱 사이도 거리로 계산
+            if item["id"] in chosen:
+                return False
+            return all(
+                min((d - u) % deck_count, (u - d) % deck_count) >= window
+                for u in used_in.get(item["id"], [])
+            )
+
+        rounds = []
+        for slot in slots[d * ROUNDS_PER_DECK:(d + 1) * ROUNDS_PER_DECK]:
+            for subject in [slot] + [s for s in by_share if s != slot]:
+                drawn = pools[subject].draw(ROUND_SIZE, usable)
+                if len(drawn) == ROUND_SIZE:
+                    break
+            else:
+                continue
+            if subject != slot:
+                substituted += 1
+            chosen.update(item["id"] for item in drawn)
+            rounds.append((subject, drawn))
+
+        for item_id in chosen:
+            used_in.setdefault(item_id, []).append(d)
+        decks.append(rounds)
+
+    return decks, substituted
+
+
+def export_decks(
+    content_dir: Path,
+    output_dir: Path,
+    deck_count: int,
+    window: int
+) -> Dict[str, Any]:
+    """학년군별 덱 파일과 decks/index.json 매니페스트 작성"""
+    all_items = [item for _, items in load_bank(content_dir) for item in items]
+    manifest = {
+        "roundsPerDeck": ROUNDS_PER_DECK,
+        "roundSize": ROUND_SIZE,
+        "window": window,
+        "gradeBands": {},
+    }
+
+    for grade_band in GRADE_BANDS:
+        band_items = [i for i in all_items if grade_band in (i.get("gradeBand") or [])]
+        if not band_items:
+            continue
+
+        decks, substituted = build_decks(band_items, grade_band, deck_count, window)
+        band_dir = output_dir / grade_band.lower()
+        band_dir.mkdir(parents=True, exist_ok=True)
+        for stale in band_dir.glob("deck-*.json"):
+            stale.unlink()
+
+        files = []
+        for d, rounds in enumerate(decks):
+            filename = f"deck-{d:03d}.json"
+            with open(band_dir / filename, "w", encoding="utf-8") as f:
+                json.dump({
+                    "gradeBand": grade_band,
+                    "deck": d,
+                    "rounds": [
+                        {"subject": subject, "itemIds": [item["id"] for item in round_items], "items": round_items}
+                        for subject, round_items in rounds
+                    ],
+                }, f, ensure_ascii=False, separators=(",", ":"))
+            files.append(f"decks/{grade_band.lower()}/{filename}")
+
+        manifest["gradeBands"][grade_band] = files
+        short = sum(1 for rounds in decks if len(rounds) < ROUNDS_PER_DECK)
+        print(f"  {grade_band}: 덱 {len(decks)}개 (다른 과목으로 바꾼 라운드 {substituted}개, 라운드 부족 덱 {short}개)")
+
+    with open(output_dir / "index.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return manifest
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="학년군별 세션 덱 사전 생성")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="콘텐츠 루트 디렉토리")
+    parser.add_argument("--decks", type=int, default=28, help="학년군당 순환 덱 개수")
+    parser.add_argument("--window", type=int, default=7,
+                        help="같은 문항이 다시 나오지 않는 연속 덱 수")
+    parser.add_argument("--output", type=str, default=None,
+                        help="출력 디렉토리 (기본: <content>/decks)")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("세션 덱 생성")
+    print(f"덱: {args.decks}개 × 라운드 {ROUNDS_PER_DECK}개 × {ROUND_SIZE}문항, 중복 금지 구간: {args.window}개 덱")
+    print("=" * 60)
+
+    content_dir = Path(args.content)
+    output_dir = Path(args.output) if args.output else content_dir / "decks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    export_decks(content_dir, output_dir, args.decks, args.window)
+
+    print(f"\n✓ {output_dir / 'index.json'} 생성")
+    print("\n✅ 덱 생성 완료!")
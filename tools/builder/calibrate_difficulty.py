@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+문항 난이도 보정
+학습 로그(sessionLogs/gameLogs 내보내기)에서 Rasch(1PL IRT) 모델을 일괄 적합하여
+문항별 difficulty(1..10)를 추정하고, 다음 내보내기 때 생성기가 적용할 테이블로 저장
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from bank import DEFAULT_CONTENT_DIR, DEFAULT_CALIBRATION_PATH, load_bank
+from logs import load_responses
+
+# difficulty 1단계 = 0.5 logit (1..10 → -2.25..+2.25 logit)
+LOGIT_PER_STEP = 0.5
+DIFFICULTY_CENTER = 5.5
+
+# 사전분포 표준편차: 문항은 기존 추정 난이도, 학습자는 0을 중심으로 수축
+ITEM_PRIOR_SD = 1.0
+LEARNER_PRIOR_SD = 1.5
+
+
+def difficulty_to_logit(difficulty: np.ndarray) -> np.ndarray:
+    return (difficulty - DIFFICULTY_CENTER) * LOGIT_PER_STEP
+
+
+def logit_to_difficulty(logit: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(DIFFICULTY_CENTER + logit / LOGIT_PER_STEP), 1, 10).astype(np.int64)
+
+
+def fit_rasch(
+    learner: np.ndarray,
+    item: np.ndarray,
+    score: np.ndarray,
+    n_learners: int,
+    prior_logit: np.ndarray,
+    max_iter: int = 50,
+    tol: float = 1e-4
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    P(정답) = sigmoid(theta[learner] - b[item])를 MAP로 적합
+    학습자/문항 파라미터를 번갈아 대각 Newton 한 스텝씩 갱신 (모든 응답을 bincount로 일괄 집계)
+    score는 0..1 (라운드 정답률 같은 부분 점수 허용)
+    """
+    n_items = len(prior_logit)
+    theta = np.zeros(n_learners)
+    b = prior_logit.astype(np.float64).copy()
+    score = score.astype(np.float64)
+
+    def residual_and_info():
+        p = 1.0 / (1.0 + np.exp(b[item] - theta[learner]))
+        return p - score, p * (1.0 - p)
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        resid, info = residual_and_info()
+        grad = np.bincount(learner, resid, n_learners) + theta / LEARNER_PRIOR_SD ** 2
+        hess = np.bincount(learner, info, n_learners) + 1.0 / LEARNER_PRIOR_SD ** 2
+        theta -= grad / hess
+
+        resid, info = residual_and_info()
+        grad = -np.bincount(item, resid, n_items) + (b - prior_logit) / ITEM_PRIOR_SD ** 2
+        hess = np.bincount(item, info, n_items) + 1.0 / ITEM_PRIOR_SD ** 2
+        step = grad / hess
+        b -= step
+
+        if np.max(np.abs(step), initial=0.0) < tol:
+            break
+
+    return theta, b, iterations
+
+
+def calibrate(
+    responses: Dict[str, np.ndarray],
+    prior_difficulty: Dict[str, float],
+    min_responses: int = 20
+) -> Dict[str, Any]:
+    """응답 열 배열로부터 보정 테이블 구성"""
+    item_ids, item_idx = np.unique(responses["item"], return_inverse=True)
+    item_idx = item_idx.reshape(-1)
+    prior = np.array([prior_difficulty.get(i, DIFFICULTY_CENTER) for i in item_ids], dtype=np.float64)
+    n_learners = int(responses["learner"].max()) + 1 if len(responses["learner"]) else 0
+
+    _, b, iterations = fit_rasch(
+        responses["learner"], item_idx, responses["score"], n_learners, difficulty_to_logit(prior)
+    )
+
+    counts = np.bincount(item_idx, minlength=len(item_ids))
+    difficulty = logit_to_difficulty(b)
+    keep = np.flatnonzero(counts >= min_responses)
+
+    return {
+        "model": "rasch",
+        "logitPerStep": LOGIT_PER_STEP,
+        "minResponses": min_responses,
+        "learners": n_learners,
+        "responses": int(len(item_idx)),
+        "iterations": iterations,
+        "items": {
+            str(item_ids[i]): {
+                "difficulty": int(difficulty[i]),
+                "logit": round(float(b[i]), 3),
+                "responses": int(counts[i]),
+            }
+            for i in keep
+        },
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="학습 로그 기반 문항 난이도 보정")
+    parser.add_argument("exports", nargs="+", help="exportData() JSON 파일 또는 디렉토리")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="사전 난이도를 읽을 콘텐츠 루트 디렉토리")
+    parser.add_argument("--min-responses", type=int, default=20,
+                        help="보정값을 기록할 최소 응답 수")
+    parser.add_argument("--output", type=str, default=str(DEFAULT_CALIBRATION_PATH),
+                        help="보정 테이블 출력 경로")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("문항 난이도 보정 (Rasch)")
+    print("=" * 60)
+
+    prior_difficulty = {
+        item["id"]: float(item.get("difficulty", DIFFICULTY_CENTER))
+        for _, items in load_bank(Path(args.content))
+        for item in items
+    }
+    responses = load_responses(args.exports)
+    print(f"\n응답: {len(responses['score'])}개 (정확 {int(responses['exact'].sum())}개)")
+
+    table = calibrate(responses, prior_difficulty, min_responses=args.min_responses)
+
+    changed = sum(
+        1 for item_id, entry in table["items"].items()
+        if prior_difficulty.get(item_id) != entry["difficulty"]
+    )
+    print(f"학습자: {table['learners']}명, 반복: {table['iterations']}회")
+    print(f"보정 문항: {len(table['items'])}개 (난이도 변경 {changed}개)")
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    print(f"\n✓ {output_path} 생성")
+    print("\n✅ 보정 완료! write_calibration.py 또는 다음 생성기 실행 시 difficulty에 반영됩니다.")
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+빌드 지문 (재현 가능한 빌드 / no-op 감지)
+생성기 소스(템플릿 포함), 의존성 버전, 난이도 보정 테이블, 시드 범위로부터
+입력 파일별 → 출력 샤드별 → 루트 순서의 Merkle 해시를 출력 없이 계산
+루트가 커밋된 지문(또는 아직 병합되지 않은 빌드 PR의 지문)과 같으면 생성/내보내기를 통째로 건너뛴다
+시드 오프셋은 주차가 아니라 병합된 지문의 오프셋에서 한 단계씩 전진 → 이전 빌드가 병합되기 전에는 같은 값
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from bank import DEFAULT_CONTENT_DIR, REPO_ROOT, iter_bank_files
+
+TOOLS_DIR = REPO_ROOT / "tools"
+DEFAULT_FINGERPRINT_PATH = TOOLS_DIR / "build-fingerprint.json"
+
+# 과목별 생성기가 내보내는 학년군 파일 (export_to_json의 파일 이름 규칙)
+GENERATORS = {
+    "math": ["es56", "ms1"],
+    "english": ["es56", "ms1"],
+    "science": ["es56", "ms1"],
+    "social": ["es", "ms1"],
+}
+
+# 생성기가 import하는 다른 모듈 (tools/ 기준 경로)
+GENERATOR_INPUTS = {
+    "english": ["ingest/tatoeba.py"],
+}
+
+# 모든 생성 샤드에 영향을 주는 입력 (tools/ 기준 경로)
+SHARED_INPUTS = [
+    "requirements.txt",
+    "builder/bank.py",
+    "builder/write_calibration.py",
+    "calibration/difficulty.json",
+]
+
+# 빌드 1회당 시드 오프셋 전진 폭
+OFFSET_STEP = 30
+
+# 콘텐츠 전체에서 파생되는 산출물과 그 빌더
+DERIVED = {
+    "decks": ["builder/bank.py", "builder/build_decks.py"],
+    "id-index": ["builder/bank.py", "builder/id_index.py"],
+}
+
+
+def file_hash(path: Path) -> str:
+    """파일 내용의 sha256 (없으면 'missing')"""
+    if not path.exists():
+        return "missing"
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def node_hash(payload: Dict[str, Any]) -> str:
+    """자식 해시와 파라미터를 정규화된 JSON으로 묶어 해시"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compute_fingerprint(
+    seeds: Dict[str, int],
+    offset: int,
+    content_dir: Path = DEFAULT_CONTENT_DIR,
+    corpus_index: Optional[Path] = None,
+    corpus_items: int = 100
+) -> Dict[str, Any]:
+    """출력 파일을 만들지 않고 입력 → 샤드 → 루트 해시 계산"""
+    inputs: Dict[str, str] = {}
+
+    def leaf(rel: str) -> str:
+        inputs[rel] = file_hash(TOOLS_DIR / rel)
+        return inputs[rel]
+
+    shared = [leaf(rel) for rel in SHARED_INPUTS]
+    shards: Dict[str, str] = {}
+
+    for subject, bands in GENERATORS.items():
+        generator = [leaf(f"generators/{subject}/build_bank.py")]
+        generator.extend(leaf(rel) for rel in GENERATOR_INPUTS.get(subject, []))
+        params: Dict[str, Any] = {"seeds": seeds[subject], "offset": offset}
+        if subject == "english" and corpus_index is not None:
+            params["corpus"] = file_hash(corpus_index / "manifest.json")
+            params["corpusItems"] = corpus_items
+        for band in bands:
+            name = f"{subject}/{subject}.{band}.generated.json"
+            shards[name] = node_hash({"shard": name, "inputs": [*generator, *shared], "params": params})
+
+    # 손으로 작성한 파일(core 등)은 생성기가 없으므로 내용 자체가 잎
+    for path in iter_bank_files(content_dir):
+        rel = path.relative_to(content_dir).as_posix()
+        if rel not in shards:
+            shards[rel] = file_hash(path)
+
+    content = node_hash({"shards": shards})
+    derived = {
+        name: node_hash({"inputs": [leaf(rel) for rel in builders], "content": content})
+        for name, builders in DERIVED.items()
+    }
+
+    return {
+        "root": node_hash({"content": content, "derived": derived}),
+        "params": {"seeds": seeds, "offset": offset},
+        "inputs": dict(sorted(inputs.items())),
+        "shards": dict(sorted(shards.items())),
+        "derived": derived,
+    }
+
+
+def load_fingerprint(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def next_offset(committed: Dict[str, Any], step: int = OFFSET_STEP) -> int:
+    """병합된 지문의 오프셋 다음 값 (지문이 없으면 0)"""
+    if "params" not in committed:
+        return 0
+    return committed["params"]["offset"] + step
+
+
+def changed_entries(current: Dict[str, Any], committed: Dict[str, Any]) -> List[str]:
+    """입력/샤드/파생 산출물 중 해시가 달라진 항목 이름"""
+    changed = []
+    for section in ("inputs", "shards", "derived"):
+        before = committed.get(section, {})
+        for name, value in current[section].items():
+            if before.get(name) != value:
+                changed.append(f"{section}:{name}")
+        changed.extend(f"{section}:{name} (삭제)" for name in before if name not in current[section])
+    return changed
+
+
+def parse_seeds(pairs: List[str]) -> Dict[str, int]:
+    """['math=80', 'english=15', ...] → {'math': 80, ...}"""
+    seeds = {}
+    for pair in pairs:
+        subject, _, value = pair.partition("=")
+        if not value.isdigit():
+            raise ValueError(f"'과목=개수' 형식이 아닙니다: {pair}")
+        seeds[subject] = int(value)
+    missing = set(GENERATORS) - set(seeds)
+    if missing:
+        raise ValueError(f"시드 개수가 없는 과목: {', '.join(sorted(missing))}")
+    return seeds
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="빌드 지문 계산 / no-op 감지")
+    parser.add_argument("--seeds", nargs="+", default=None,
+                        help="과목별 생성 개수 (예: math=80 english=15 science=3 social=2)")
+    parser.add_argument("--offset", type=int, default=0, help="시드 오프셋")
+    parser.add_argument("--next-offset", action="store_true",
+                        help="커밋된 지문 기준 다음 시드 오프셋만 출력")
+    parser.add_argument("--offset-step", type=int, default=OFFSET_STEP,
+                        help="빌드 1회당 시드 오프셋 전진 폭")
+    parser.add_argument("--pending", type=str, default=None,
+                        help="열려 있는 빌드 PR의 지문 파일 (같으면 생략, 닫힌 PR의 지문은 넘기지 말 것)")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="콘텐츠 루트 디렉토리")
+    parser.add_argument("--corpus-index", type=str, default=None,
+                        help="영어 생성기에 넘기는 Tatoeba 인덱스 디렉토리")
+    parser.add_argument("--corpus-items", type=int, default=100, help="학년군당 코퍼스 문항 개수")
+    parser.add_argument("--fingerprint", type=str, default=str(DEFAULT_FINGERPRINT_PATH),
+                        help="커밋된 지문 파일 경로")
+    parser.add_argument("--write", action="store_true",
+                        help="검증 대신 현재 지문을 기록 (빌드 완료 후)")
+
+    args = parser.parse_args()
+    fingerprint_path = Path(args.fingerprint)
+
+    if args.next_offset:
+        print(next_offset(load_fingerprint(fingerprint_path), args.offset_step))
+        sys.exit(0)
+
+    if not args.seeds:
+        parser.error("--seeds가 필요합니다")
+    try:
+        seeds = parse_seeds(args.seeds)
+    except ValueError as e:
+        parser.error(f"--seeds: {e}")
+
+    print("=" * 60)
+    print("빌드 지문")
+    print(f"시드 오프셋: {args.offset}")
+    print("=" * 60)
+
+    current = compute_fingerprint(
+        seeds,
+        args.offset,
+        content_dir=Path(args.content),
+        corpus_index=Path(args.corpus_index) if args.corpus_index else None,
+        corpus_items=args.corpus_items,
+    )
+    print(f"\n루트: {current['root']}")
+
+    if args.write:
+        with open(fingerprint_path, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ {fingerprint_path} 기록")
+        sys.exit(0)
+
+    committed = load_fingerprint(fingerprint_path)
+    pending = load_fingerprint(Path(args.pending)) if args.pending else {}
+    unchanged = current["root"] in (committed.get("root"), pending.get("root"))
+
+    # GitHub Actions 이후 단계에서 steps.<id>.outputs.changed로 분기
+    github_output = os.environ.get("GITHUB_OUTPUT")
+    if github_output:
+        with open(github_output, "a", encoding="utf-8") as f:
+            f.write(f"changed={'false' if unchanged else 'true'}\n")
+
+    if unchanged:
+        where = "커밋된 지문" if committed.get("root") == current["root"] else "병합 대기 중인 빌드 PR"
+        print(f"\n✅ 변경 없음 ({where}과 동일): 생성/내보내기 생략")
+    else:
+        print(f"\n변경 항목: {len(changed_entries(current, committed))}개")
+        for entry in changed_entries(current, committed):
+            print(f"  - {entry}")
+        print("\n⚠️ 변경 있음: 재생성 필요")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+문항 ID 조회 인덱스
+콘텐츠 파일(샤드) 안에서 각 문항 JSON 객체의 바이트 위치를 기록한 정렬된 고정 폭 인덱스
+id-index.bin : 레코드 = id(24바이트, NUL 패딩) + shard(uint16) + offset(uint32) + length(uint32)
+id-index.json: 샤드 목록(바이트 크기 포함)과 레코드 형식 — 샤드 크기가 바뀌면 인덱스를 쓰지 않음
+→ FSRS due 항목 20개를 가져올 때 은행 전체 대신 바이트 범위 읽기 몇 번으로 충분
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from bank import DEFAULT_CONTENT_DIR, iter_bank_files, iter_item_spans
+
+ID_WIDTH = 24
+RECORD = struct.Struct(f"<{ID_WIDTH}sHII")
+
+INDEX_FILENAME = "id-index.bin"
+MANIFEST_FILENAME = "id-index.json"
+
+
+def scan_shard(path: Path) -> List[Tuple[str, int, int]]:
+    """
+    샤드 파일에서 (id, 바이트 오프셋, 바이트 길이) 목록 추출
+    문항 경계는 bank.iter_item_spans (load_bank처럼 배열/단일 객체 파일 모두 허용),
+    문자 위치는 앞부분을 누적 인코딩해 바이트 위치로 변환
+    """
+    text = path.read_text(encoding="utf-8")
+    entries = []
+    char_pos, byte_pos = 0, 0
+
+    def to_bytes(index: int) -> int:
+        nonlocal char_pos, byte_pos
+        byte_pos += len(text[char_pos:index].encode("utf-8"))
+        char_pos = index
+        return byte_pos
+
+    for item, start, end in iter_item_spans(text):
+        start_byte = to_bytes(start)
+        entries.append((str(item["id"]), start_byte, to_bytes(end) - start_byte))
+
+    return entries
+
+
+def build_index(content_dir: Path) -> Dict[str, Any]:
+    """콘텐츠 디렉토리의 모든 샤드를 스캔해 인덱스 파일 두 개를 작성"""
+    shards, sizes, records, duplicates = [], [], {}, []
+
+    for shard_idx, path in enumerate(iter_bank_files(content_dir)):
+        shards.append(path.relative_to(content_dir).as_posix())
+        sizes.append(path.stat().st_size)
+        for item_id, offset, length in scan_shard(path):
+            key = item_id.encode("ascii")
+            if len(key) > ID_WIDTH:
+                raise ValueError(f"id가 {ID_WIDTH}바이트를 넘습니다: {item_id}")
+            if key in records:
+                # 중복 id는 먼저 나온 문항을 유지 (lint_bank.py DUPLICATE_ID)
+                duplicates.append(item_id)
+                continue
+            records[key] = (shard_idx, offset, length)
+
+    with open(content_dir / INDEX_FILENAME, "wb") as f:
+        for key in sorted(records):
+            f.write(RECORD.pack(key, *records[key]))
+
+    manifest = {
+        "recordSize": RECORD.size,
+        "idWidth": ID_WIDTH,
+        "layout": "id[24] NUL-padded, shard uint16 LE, offset uint32 LE, length uint32 LE",
+        "count": len(records),
+        "shards": shards,
+        "shardSizes": sizes,
+    }
+    with open(content_dir / MANIFEST_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    manifest["duplicates"] = duplicates
+    return manifest
+
+
+class IdIndex:
+    """mmap으로 연 인덱스에서 이진 탐색으로 문항 위치/본문 조회"""
+
+    def __init__(self, content_dir: Path = DEFAULT_CONTENT_DIR):
+        self.content_dir = content_dir
+        with open(content_dir / MANIFEST_FILENAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.shards = manifest["shards"]
+
+        # 인덱스를 만든 뒤 샤드가 바뀌었으면 바이트 위치를 믿을 수 없음
+        for shard, size in zip(self.shards, manifest.get("shardSizes") or [None] * len(self.shards)):
+            path = content_dir / shard
+            if size is None or not path.exists() or path.stat().st_size != size:
+                raise ValueError(f"인덱스 이후 샤드가 바뀌었습니다: {shard} (id_index.py로 다시 생성)")
+
+        self._file = open(content_dir / INDEX_FILENAME, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = len(self._mm) // RECORD.size
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "IdIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _key_at(self, i: int) -> bytes:
+        start = i * RECORD.size
+        return self._mm[start:start + ID_WIDTH]
+
+    def locate(self, item_id: str) -> Optional[Tuple[str, int, int]]:
+        """id → (샤드 경로, 바이트 오프셋, 바이트 길이). 없으면 None"""
+        key = item_id.encode("ascii").ljust(ID_WIDTH, b"\0")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self.count or self._key_at(lo) != key:
+            return None
+        _, shard, offset, length = RECORD.unpack_from(self._mm, lo * RECORD.size)
+        return self.shards[shard], offset, length
+
+    def get_items(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 id를 샤드/오프셋 순으로 정렬해 바이트 범위만 읽어 파싱"""
+        located = sorted(
+            (loc, item_id) for item_id in item_ids
+            if (loc := self.locate(item_id)) is not None
+        )
+        items, handles = {}, {}
+        try:
+            for (shard, offset, length), item_id in located:
+                if shard not in handles:
+                    handles[shard] = open(self.content_dir / shard, "rb")
+                f = handles[shard]
+                f.seek(offset)
+                try:
+                    item = json.loads(f.read(length).decode("utf-8"))
+                except ValueError:
+                    item = None
+                if not isinstance(item, dict) or item.get("id") != item_id:
+                    raise ValueError(f"인덱스 위치의 문항이 {item_id}가 아닙니다: {shard} (id_index.py로 다시 생성)")
+                items[item_id] = item
+        finally:
+            for f in handles.values():
+                f.close()
+        return items
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="문항 ID 조회 인덱스 생성/조회")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="콘텐츠 루트 디렉토리 (인덱스도 여기에 작성)")
+    parser.add_argument("--lookup", nargs="+", default=None,
+                        help="인덱스를 만들지 않고 주어진 id 조회")
+
+    args = parser.parse_args()
+    content_dir = Path(args.content)
+
+    if args.lookup:
+        with IdIndex(content_dir) as index:
+            found = index.get_items(args.lookup)
+        for item_id in args.lookup:
+            print(json.dumps(found.get(item_id), ensure_ascii=False))
+    else:
+        print("=" * 60)
+        print("문항 ID 인덱스 생성")
+        print("=" * 60)
+
+        manifest = build_index(content_dir)
+
+        print(f"\n✓ {content_dir / INDEX_FILENAME}: {manifest['count']}개 레코드 × {RECORD.size}바이트")
+        print(f"✓ {content_dir / MANIFEST_FILENAME}: 샤드 {len(manifest['shards'])}개")
+        if manifest["duplicates"]:
+            print(f"  ⚠️ 중복 id {len(manifest['duplicates'])}개는 첫 문항만 색인")
+        print("\n✅ 인덱스 생성 완료!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+KLL 분위수 스케치
+고정 메모리(약 k·log(n/k) 원소)로 스트림의 분위수를 근사하며, 스케치끼리 병합 가능
+"""
+
+import math
+from typing import List, Dict, Any
+
+import numpy as np
+
+
+class KLLSketch:
+    """
+    레벨 h의 원소는 가중치 2^h를 가진다.
+    레벨이 용량을 넘으면 정렬 후 한 칸씩 건너 절반만 다음 레벨로 올린다 (compaction).
+    """
+
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.zeros(0, dtype=np.float64)]
+        # 레벨별로 홀/짝 선택을 번갈아 해서 결과를 재현 가능하게 유지
+        self._parity: List[int] = [0]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            buf = self.levels[level]
+            if len(buf) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.zeros(0, dtype=np.float64))
+                    self._parity.append(0)
+                buf = np.sort(buf)
+                # 홀수 개면 마지막 하나는 현재 레벨에 남김
+                keep = buf[-1:] if len(buf) % 2 else buf[:0]
+                pairs = buf[:len(buf) - len(keep)]
+                promoted = pairs[self._parity[level]::2]
+                self._parity[level] ^= 1
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+            level += 1
+
+    def update(self, values: np.ndarray):
+        """값 배열을 한 번에 추가"""
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        self.count += len(values)
+        # 큰 배치도 용량 단위로 나눠 넣어 메모리를 일정하게 유지
+        step = max(self.k, 1)
+        for start in range(0, len(values), step):
+            self.levels[0] = np.concatenate((self.levels[0], values[start:start + step]))
+            self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        """다른 스케치를 이 스케치에 병합"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.zeros(0, dtype=np.float64))
+            self._parity.append(0)
+        for level, buf in enumerate(other.levels):
+            self.levels[level] = np.concatenate((self.levels[level], buf))
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """가중 누적분포에서 분위수 조회"""
+        if self.count == 0:
+            return [float("nan")] * len(qs)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(buf), 2 ** h) for h, buf in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, cum = values[order], np.cumsum(weights[order])
+        targets = np.asarray(qs, dtype=np.float64) * cum[-1]
+        idx = np.minimum(np.searchsorted(cum, targets, side="left"), len(values) - 1)
+        return [float(v) for v in values[idx]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "count": self.count,
+            "levels": [[round(float(v), 1) for v in buf] for buf in self.levels],
+            "parity": list(self._parity),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(k=data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [np.asarray(buf, dtype=np.float64) for buf in data["levels"]]
+        sketch._parity = list(data["parity"])
+        return sketch
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+반응시간 기준선 집계
+내보낸 학습 로그를 파일 단위로 흘려보내며 (subject, area, difficulty, gradeBand)별
+KLL 분위수 스케치를 갱신하고, 콘텐츠 매니페스트 옆에 기준선 테이블을 게시
+스케치 상태는 저장/병합 가능 → 배치별 병렬 집계, 주간 증분 집계
+상태에는 학습자별 처리 완료 시각만 저장 (학습자 수에 비례) → 전체 기록을 담은 다음 내보내기에서는 새 세션만 반영
+병렬 집계는 --shard로 학습자를 나눠 배치끼리 학습자가 겹치지 않게 한다
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from bank import DEFAULT_CONTENT_DIR, load_bank
+from kll import KLLSketch
+from logs import iter_response_batches
+
+QUANTILES = [0.5, 0.8, 0.9]
+SKETCH_K = 200
+
+GroupKey = Tuple[str, str, int, str]
+
+
+class BankIndex:
+    """문항 id → {gradeBand: 그룹 키 위치} (gradeBand가 여러 개면 밴드별로 하나씩)"""
+
+    def __init__(self, bank: List[Tuple[str, List[Dict[str, Any]]]]):
+        self.keys: List[GroupKey] = []
+        key_pos: Dict[GroupKey, int] = {}
+        self.item_keys: Dict[str, Dict[str, int]] = {}
+
+        for _, items in bank:
+            for item in items:
+                positions = {}
+                for band in item.get("gradeBand") or [""]:
+                    key = (item["subject"], item["area"], int(item.get("difficulty", 0)), band)
+                    if key not in key_pos:
+                        key_pos[key] = len(self.keys)
+                        self.keys.append(key)
+                    positions[band] = key_pos[key]
+                self.item_keys[item["id"]] = positions
+
+    def resolve(self, item_id: str, grade_band: str) -> int:
+        """
+        응답 하나가 들어갈 그룹 위치 (없으면 -1)
+        학습자 프로필의 gradeBand를 우선, 없거나 문항에 없는 밴드면 문항의 밴드가 하나일 때만 사용
+        """
+        positions = self.item_keys.get(item_id, {})
+        if grade_band in positions:
+            return positions[grade_band]
+        if len(positions) == 1:
+            return next(iter(positions.values()))
+        return -1
+
+    def group(self, item_ids: np.ndarray, grade_band: str) -> Tuple[np.ndarray, np.ndarray]:
+        """응답별 item id → (응답 인덱스, 그룹 인덱스). 은행에 없거나 밴드를 정할 수 없는 응답은 제외"""
+        unique_ids, inverse = np.unique(item_ids, return_inverse=True)
+        per_unique = np.array([self.resolve(str(i), grade_band) for i in unique_ids], dtype=np.int64)
+        group_idx = per_unique[inverse.reshape(-1)] if len(per_unique) else per_unique
+        response_idx = np.flatnonzero(group_idx >= 0)
+        return response_idx, group_idx[response_idx]
+
+
+def in_shard(learner: str, shard: Optional[Tuple[int, int]]) -> bool:
+    """학습자 키 해시로 나눈 shard = (번호, 개수)에 속하면 True (shard가 없으면 항상 True)"""
+    if shard is None:
+        return True
+    index, count = shard
+    return int.from_bytes(hashlib.sha1(learner.encode("utf-8")).digest()[:8], "big") % count == index
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """'0/4' → (0, 4)"""
+    index, _, count = value.partition("/")
+    if not (index.isdigit() and count.isdigit()) or not 0 <= int(index) < int(count):
+        raise ValueError(f"'번호/개수' 형식이 아닙니다: {value}")
+    return int(index), int(count)
+
+
+def load_state(path: Path) -> Tuple[Dict[str, KLLSketch], Dict[str, float]]:
+    """저장된 스케치 상태 로드 → (그룹 키 문자열 → 스케치, 학습자 → 처리 완료 시각)"""
+    if not path.exists():
+        return {}, {}
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    sketches = {key: KLLSketch.from_dict(data) for key, data in state["sketches"].items()}
+    return sketches, state.get("learners", {})
+
+
+def save_state(path: Path, sketches: Dict[str, KLLSketch], learners: Dict[str, float]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "learners": dict(sorted(learners.items())),
+            "sketches": {key: sketches[key].to_dict() for key in sorted(sketches)},
+        }, f, ensure_ascii=False)
+
+
+def merge_states(
+    target: Dict[str, KLLSketch],
+    target_learners: Dict[str, float],
+    other: Dict[str, KLLSketch],
+    other_learners: Dict[str, float]
+) -> Dict[str, KLLSketch]:
+    """
+    학습자가 겹치지 않는 상태 병합 (--shard로 나눈 배치는 항상 겹치지 않음)
+    같은 학습자가 양쪽에 있으면 스케치에서 어느 응답이 중복인지 가릴 수 없으므로 거부
+    """
+    overlap = target_learners.keys() & other_learners.keys()
+    if overlap:
+        raise ValueError(f"두 상태에 같은 학습자 {len(overlap)}명이 있습니다 (배치는 --shard로 나눠 집계)")
+    for key, sketch in other.items():
+        if key in target:
+            target[key].merge(sketch)
+        else:
+            target[key] = sketch
+    target_learners.update(other_learners)
+    return target
+
+
+def aggregate(
+    export_paths: List[str],
+    index: BankIndex,
+    sketches: Dict[str, KLLSketch],
+    learners: Dict[str, float],
+    shard: Optional[Tuple[int, int]] = None
+) -> int:
+    """
+    내보내기 파일을 하나씩 읽어 스케치 갱신, 추가한 응답 수 반환
+    learners(학습자 → 처리 완료 시각) 이후의 세션만 반영하고 값을 갱신
+    문항별 반응시간(exact)만 사용 — 라운드 평균은 분포를 좁혀 분위수를 왜곡한다
+    """
+    added = 0
+    batches = iter_response_batches(
+        export_paths, since=learners, include=lambda learner: in_shard(learner, shard)
+    )
+    for batch in batches:
+        ok = batch["exact"] & np.isfinite(batch["latency"]) & (batch["latency"] > 0)
+        latency = batch["latency"][ok]
+        response_idx, group_idx = index.group(batch["item"][ok], batch["gradeBand"])
+        if not len(group_idx):
+            continue
+
+        order = np.argsort(group_idx, kind="stable")
+        groups, starts = np.unique(group_idx[order], return_index=True)
+        for g, chunk in zip(groups, np.split(latency[response_idx[order]], starts[1:])):
+            key = "|".join(str(part) for part in index.keys[g])
+            sketches.setdefault(key, KLLSketch(k=SKETCH_K)).update(chunk)
+        added += len(group_idx)
+    return added
+
+
+def baseline_table(sketches: Dict[str, KLLSketch], min_count: int = 1) -> Dict[str, Any]:
+    """게시용 기준선 테이블 (분위수는 ms 정수)"""
+    groups = []
+    for key in sorted(sketches):
+        sketch = sketches[key]
+        if sketch.count < min_count:
+            continue
+        subject, area, difficulty, band = key.split("|")
+        entry = {
+            "subject": subject,
+            "area": area,
+            "difficulty": int(difficulty),
+            "gradeBand": band,
+            "count": sketch.count,
+        }
+        for q, value in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+            entry[f"p{int(q * 100)}"] = int(round(value))
+        groups.append(entry)
+    return {"quantiles": QUANTILES, "groups": groups}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="반응시간 기준선 집계 (KLL 스케치)")
+    parser.add_argument("exports", nargs="*", help="exportData() JSON 파일 또는 디렉토리")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="콘텐츠 루트 디렉토리 (기준선 테이블도 여기에 게시)")
+    parser.add_argument("--state", type=str, default="latency-sketches.json",
+                        help="스케치 상태 파일 (있으면 이어서 집계, --merge면 병합 결과를 기록)")
+    parser.add_argument("--shard", type=str, default=None,
+                        help="학습자 키 해시로 나눈 배치 중 이 배치만 집계 (예: 0/4)")
+    parser.add_argument("--merge", nargs="*", default=[],
+                        help="--shard로 병렬 집계한 상태 파일들을 병합해 게시")
+    parser.add_argument("--min-count", type=int, default=30,
+                        help="게시할 그룹의 최소 응답 수")
+    parser.add_argument("--output", type=str, default=None,
+                        help="기준선 테이블 경로 (기본: <content>/latency-baselines.json)")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("반응시간 기준선 집계")
+    print("=" * 60)
+
+    content_dir = Path(args.content)
+    state_path = Path(args.state)
+
+    if args.merge:
+        if args.exports or args.shard:
+            parser.error("--merge는 내보내기 파일/--shard와 함께 쓸 수 없습니다")
+        # 병합 결과는 매번 입력 상태들로부터 새로 만듦 → 같은 명령을 다시 실행해도 결과가 같음
+        sketches, learners = {}, {}
+        for other_path in args.merge:
+            other, other_learners = load_state(Path(other_path))
+            try:
+                merge_states(sketches, learners, other, other_learners)
+            except ValueError as e:
+                parser.error(f"{other_path}: {e}")
+            print(f"  병합: {other_path} ({len(other)}개 그룹, 학습자 {len(other_learners)}명)")
+    else:
+        try:
+            shard = parse_shard(args.shard) if args.shard else None
+        except ValueError as e:
+            parser.error(f"--shard: {e}")
+        sketches, learners = load_state(state_path)
+        added = aggregate(args.exports, BankIndex(load_bank(content_dir)), sketches, learners, shard)
+        print(f"\n추가 응답: {added}개, 그룹: {len(sketches)}개, 학습자: {len(learners)}명")
+
+    save_state(state_path, sketches, learners)
+    print(f"✓ {state_path} 저장")
+
+    table = baseline_table(sketches, min_count=args.min_count)
+    output_path = Path(args.output) if args.output else content_dir / "latency-baselines.json"
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, indent=2)
+
+    print(f"✓ {output_path} 게시: {len(table['groups'])}개 그룹")
+    print("\n✅ 집계 완료!")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+문항 품질 린트
+문항 은행 전체를 열(column) 배열로 적재한 뒤 numpy 일괄 연산으로 검사
+(중복 ID, 중복 선택지, 정답 누락, 정답 노출, 난이도 범위)
+문자열 열은 가변 길이 StringDType (numpy 2) — 고정 폭 <U 배열은 가장 긴 지문 길이 × N 만큼 메모리를 잡는다
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+
+from bank import DEFAULT_CONTENT_DIR, load_bank, stem_text
+
+# 지문/스크립트 안에서 정답을 찾는 것이 문항의 의도인 영역
+LEAK_EXEMPT_AREAS = ["english.reading", "english.listening"]
+
+# 정답 노출 검사 시 토큰 경계로 취급할 문자 ("3/4", "-3", "0.5"는 한 토큰으로 유지)
+TOKEN_DELIMITERS = str.maketrans({c: " " for c in "\t\n,?!:;=()[]{}$+*÷×%<>\"'\\"})
+
+STRING = np.dtypes.StringDType()
+
+# (코드, 심각도, 설명)
+CHECKS = [
+    ("DUPLICATE_ID", "error", "같은 id를 가진 문항이 둘 이상"),
+    ("DUPLICATE_CHOICE_ID", "error", "한 문항 안에 같은 선택지 id"),
+    ("DUPLICATE_CHOICE_LABEL", "error", "한 문항 안에 같은 선택지 label"),
+    ("EMPTY_CHOICE_LABEL", "error", "비어 있는 선택지 label"),
+    ("MCQ_TOO_FEW_CHOICES", "error", "객관식인데 선택지가 2개 미만"),
+    ("ANSWER_NOT_IN_CHOICES", "error", "정답 id가 선택지에 없음"),
+    ("ANSWER_LEAK_IN_STEM", "warning", "정답 텍스트가 stem에 하나의 토큰으로 노출"),
+    ("DIFFICULTY_OUT_OF_RANGE", "error", "difficulty가 1..10 범위 밖"),
+]
+
+
+def to_columns(bank: List[Tuple[str, List[Dict[str, Any]]]]) -> Dict[str, np.ndarray]:
+    """문항 목록을 열 배열로 변환 (선택지는 (N, 최대선택지수) 2차원 배열, 빈칸은 "")"""
+    file_idx, ids, areas, kinds, stems, answers, difficulty = [], [], [], [], [], [], []
+    n_choices, flat_choice_ids, flat_choice_labels = [], [], []
+
+    for f_idx, (_, items) in enumerate(bank):
+        for item in items:
+            answer = item.get("answer") or {}
+            choices = item.get("choices") or []
+            file_idx.append(f_idx)
+            ids.append(str(item.get("id", "")))
+            areas.append(str(item.get("area", "")))
+            kinds.append(str(answer.get("kind", "")))
+            stems.append(stem_text(item))
+            answers.append("" if answer.get("value") is None else str(answer.get("value")))
+            d = item.get("difficulty")
+            difficulty.append(d if isinstance(d, (int, float)) else np.nan)
+            n_choices.append(len(choices))
+            flat_choice_ids.extend(str(c.get("id", "")) for c in choices)
+            flat_choice_labels.extend(str(c.get("label", "")) for c in choices)
+
+    n = len(ids)
+    n_choices = np.asarray(n_choices, dtype=np.int64)
+    width = max(1, int(n_choices.max()) if n else 1)
+
+    # 평탄한 선택지 배열을 (행, 열) 위치로 흩뿌려 2차원 배열 구성
+    rows = np.repeat(np.arange(n), n_choices)
+    offsets = np.concatenate(([0], np.cumsum(n_choices)[:-1])) if n else np.zeros(0, dtype=np.int64)
+    cols = np.arange(len(rows)) - np.repeat(offsets, n_choices)
+
+    def scatter(flat: List[str]) -> np.ndarray:
+        mat = np.full((n, width), "", dtype=STRING)
+        mat[rows, cols] = np.asarray(flat, dtype=STRING)
+        return mat
+
+    return {
+        "file": np.asarray(file_idx, dtype=np.int64),
+        "id": np.asarray(ids, dtype=STRING),
+        "area": np.asarray(areas, dtype=STRING),
+        "kind": np.asarray(kinds, dtype=STRING),
+        "stem": np.asarray(stems, dtype=STRING),
+        "answer": np.asarray(answers, dtype=STRING),
+        "difficulty": np.asarray(difficulty, dtype=np.float64),
+        "n_choices": n_choices,
+        "choice_id": scatter(flat_choice_ids),
+        "choice_label": scatter(flat_choice_labels),
+    }
+
+
+def run_checks(cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """검사 코드별 위반 문항 마스크 (길이 N의 bool 배열) 반환"""
+    n = len(cols["id"])
+    width = cols["choice_id"].shape[1]
+    valid = np.arange(width)[None, :] < cols["n_choices"][:, None]
+    is_mcq = cols["kind"] == "mcq"
+    masks = {}
+
+    # 중복 ID: 정렬 후 등장 횟수를 원래 위치로 되돌림
+    _, inverse, counts = np.unique(cols["id"], return_inverse=True, return_counts=True)
+    masks["DUPLICATE_ID"] = counts[inverse.reshape(-1)] > 1
+
+    def has_adjacent_duplicate(mat: np.ndarray) -> np.ndarray:
+        # 빈칸("")은 정렬 시 앞으로 모이므로 양쪽이 모두 값이 있을 때만 비교
+        s = np.sort(np.where(valid, mat, ""), axis=1)
+        return ((s[:, 1:] == s[:, :-1]) & (s[:, :-1] != "")).any(axis=1)
+
+    masks["DUPLICATE_CHOICE_ID"] = has_adjacent_duplicate(cols["choice_id"])
+    masks["DUPLICATE_CHOICE_LABEL"] = has_adjacent_duplicate(cols["choice_label"])
+    masks["EMPTY_CHOICE_LABEL"] = (valid & (np.strings.strip(cols["choice_label"]) == "")).any(axis=1)
+    masks["MCQ_TOO_FEW_CHOICES"] = is_mcq & (cols["n_choices"] < 2)
+
+    match = valid & (cols["choice_id"] == cols["answer"][:, None])
+    has_answer = match.any(axis=1)
+    masks["ANSWER_NOT_IN_CHOICES"] = is_mcq & ~has_answer
+
+    correct_label = cols["choice_label"][np.arange(n), match.argmax(axis=1)] if n else cols["answer"]
+    correct_text = np.where(is_mcq, np.where(has_answer, correct_label, ""), cols["answer"])
+
+    # 부분 문자열이 아닌 토큰 단위로 비교 ("20"이 "120"에 걸리지 않도록)
+    def tokens(arr: np.ndarray) -> np.ndarray:
+        return np.strings.add(np.strings.add(" ", np.strings.translate(arr, TOKEN_DELIMITERS)), " ")
+
+    needle = tokens(correct_text)
+    exempt = np.isin(cols["area"], LEAK_EXEMPT_AREAS)
+    masks["ANSWER_LEAK_IN_STEM"] = (
+        ~exempt & (np.strings.str_len(np.strings.strip(needle)) > 0)
+        & (np.strings.find(tokens(cols["stem"]), needle) >= 0)
+    )
+
+    d = cols["difficulty"]
+    masks["DIFFICULTY_OUT_OF_RANGE"] = ~((d >= 1) & (d <= 10))
+
+    return masks
+
+
+def build_report(
+    files: List[str],
+    cols: Dict[str, np.ndarray],
+    masks: Dict[str, np.ndarray],
+    fail_on_warning: bool = False
+) -> Dict[str, Any]:
+    """기계가 읽을 수 있는 린트 리포트 구성"""
+    blocking_levels = {"error", "warning"} if fail_on_warning else {"error"}
+    counts, issues = {}, []
+    blocking = False
+
+    for code, severity, message in CHECKS:
+        idx = np.flatnonzero(masks[code])
+        counts[code] = int(len(idx))
+        if len(idx) and severity in blocking_levels:
+            blocking = True
+        for i in idx:
+            issues.append({
+                "code": code,
+                "severity": severity,
+                "id": str(cols["id"][i]),
+                "file": files[cols["file"][i]],
+            })
+
+    return {
+        "totalItems": int(len(cols["id"])),
+        "files": files,
+        "checks": [{"code": c, "severity": s, "message": m} for c, s, m in CHECKS],
+        "counts": counts,
+        "blocking": blocking,
+        "issues": issues,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="문항 은행 품질 린트")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="콘텐츠 루트 디렉토리 (과목별 하위 디렉토리)")
+    parser.add_argument("--report", type=str, default="lint-report.json",
+                        help="JSON 리포트 출력 경로")
+    parser.add_argument("--strict", action="store_true",
+                        help="warning도 실패로 처리")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("문항 품질 린트")
+    print("=" * 60)
+
+    bank = load_bank(Path(args.content))
+    files = [rel for rel, _ in bank]
+    columns = to_columns(bank)
+    report = build_report(files, columns, run_checks(columns), fail_on_warning=args.strict)
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n검사 문항: {report['totalItems']}개 ({len(files)}개 파일)")
+    for code, severity, _ in CHECKS:
+        mark = "✓" if report["counts"][code] == 0 else ("❌" if severity == "error" else "⚠️")
+        print(f"  {mark} {code}: {report['counts'][code]}")
+    print(f"\n리포트: {args.report}")
+
+    if report["blocking"]:
+        print("\n❌ 린트 실패")
+        sys.exit(1)
+
+    print("\n✅ 린트 통과")
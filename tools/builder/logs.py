@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+학습 로그 로더
+DataManager.exportData()로 내보낸 JSON에서 문항별 응답을 열 배열로 추출
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterator, Optional, Set
+
+import numpy as np
+
+
+def iter_export_files(paths: List[str]) -> Iterator[Path]:
+    """파일 또는 디렉토리(*.json) 경로 목록을 정렬된 파일 순서로 나열"""
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            yield from sorted(path.glob("*.json"))
+        else:
+            yield path
+
+
+def export_profile(export: Dict[str, Any]) -> Dict[str, Any]:
+    """내보내기의 사용자 프로필 (앱은 id='default' 하나만 기록)"""
+    profiles = export.get("userProfile") or []
+    for profile in profiles:
+        if profile.get("id") == "default":
+            return profile
+    return profiles[0] if profiles else {}
+
+
+def learner_key(export: Dict[str, Any], fallback: str) -> str:
+    """
+    같은 학습자의 반복 내보내기를 하나로 묶는 키
+    learnerId(exportData()가 부여) → 첫 세션 시각 → 파일 이름 순으로 사용
+    """
+    profile = export_profile(export)
+    if profile.get("learnerId"):
+        return str(profile["learnerId"])
+    if profile.get("firstSessionDate"):
+        return f"first-session:{profile['firstSessionDate']}"
+    return f"file:{fallback}"
+
+
+def export_responses(
+    export: Dict[str, Any],
+    learner: str,
+    seen: Optional[Set[str]] = None,
+    since: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    내보내기 1건에서 응답 추출
+
+    - sessionLogs[].rounds[].responses가 있으면 문항별 정답/반응시간을 그대로 사용
+    - 이전 로그(responses 없음)는 라운드 정답률과 평균 반응시간을 각 문항에 배분 (exact=False)
+    - gameLogs[].result.responses가 있으면 같은 방식으로 사용
+    - exportData()는 전체 기록을 내보내므로 세션 키(학습자 + 시작 시각)가 seen에 있으면 건너뜀
+    - since가 있으면 시작 시각이 since 이하인 세션/게임도 건너뜀 (학습자별 처리 완료 시점)
+    - latest = 포함한 세션/게임 중 가장 늦은 시작 시각 (없으면 None)
+    """
+    seen = set() if seen is None else seen
+    item, subject, score, latency, exact = [], [], [], [], []
+    latest = None
+
+    def is_new(kind: str, started: Any) -> bool:
+        nonlocal latest
+        key = f"{learner}|{kind}|{started}"
+        if key in seen:
+            return False
+        if since is not None and isinstance(started, (int, float)) and started <= since:
+            return False
+        seen.add(key)
+        if isinstance(started, (int, float)):
+            latest = started if latest is None else max(latest, started)
+        return True
+
+    def add_exact(responses: List[Dict[str, Any]], subj: str):
+        for r in responses:
+            item.append(str(r["itemId"]))
+            subject.append(subj)
+            score.append(1.0 if r.get("correct") else 0.0)
+            latency.append(r.get("latencyMs", np.nan))
+            exact.append(True)
+
+    for session in export.get("sessionLogs") or []:
+        if not is_new("session", session.get("startAt")):
+            continue
+        for round_ in session.get("rounds") or []:
+            subj = str(round_.get("subject", ""))
+            if round_.get("responses"):
+                add_exact(round_["responses"], subj)
+                continue
+            ids = round_.get("items") or []
+            if not ids:
+                continue
+            ratio = min(1.0, round_.get("correct", 0) / len(ids))
+            for item_id in ids:
+                item.append(str(item_id))
+                subject.append(subj)
+                score.append(ratio)
+                latency.append(round_.get("latencyAvgMs", np.nan))
+                exact.append(False)
+
+    for game in export.get("gameLogs") or []:
+        result = game.get("result") or {}
+        if isinstance(result, dict) and result.get("responses"):
+            if is_new("game", game.get("startTime")):
+                add_exact(result["responses"], str(game.get("subject", "")))
+
+    return {
+        "item": np.asarray(item, dtype=str) if item else np.zeros(0, dtype="<U12"),
+        "subject": np.asarray(subject, dtype=str) if subject else np.zeros(0, dtype="<U8"),
+        "score": np.asarray(score, dtype=np.float32),
+        "latency": np.asarray(latency, dtype=np.float32),
+        "exact": np.asarray(exact, dtype=bool),
+        "latest": latest,
+    }
+
+
+def iter_response_batches(
+    paths: List[str],
+    seen: Optional[Set[str]] = None,
+    since: Optional[Dict[str, float]] = None,
+    include: Optional[Callable[[str], bool]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    내보내기 파일 단위로 응답 배치를 생성
+    seen(세션 키 집합)을 파일 사이에 공유해 같은 세션이 여러 내보내기에 있어도 한 번만 포함
+    since(학습자 → 처리 완료 시각)가 있으면 그 이후 세션만 포함하고 값을 갱신 (학습자 수만큼의 상태)
+    include(학습자 키)가 False인 내보내기는 건너뜀
+    """
+    seen = set() if seen is None else seen
+    for path in iter_export_files(paths):
+        with open(path, encoding="utf-8") as f:
+            export = json.load(f)
+        learner = learner_key(export, path.name)
+        if include is not None and not include(learner):
+            continue
+        batch = export_responses(export, learner, seen, None if since is None else since.get(learner))
+        if since is not None and batch["latest"] is not None:
+            since[learner] = max(since.get(learner, batch["latest"]), batch["latest"])
+        batch["learner"] = learner
+        batch["gradeBand"] = str(export_profile(export).get("gradeBand") or "")
+        yield batch
+
+
+def load_responses(paths: List[str]) -> Dict[str, np.ndarray]:
+    """모든 내보내기 파일의 응답을 하나의 열 배열 묶음으로 연결 (learner = 학습자 키 순번)"""
+    batches = list(iter_response_batches(paths))
+    columns = {
+        key: np.concatenate([b[key] for b in batches]) if batches else np.zeros(0)
+        for key in ("item", "subject", "score", "latency", "exact")
+    }
+    learners: Dict[str, int] = {}
+    columns["learner"] = np.concatenate([
+        np.full(len(b["score"]), learners.setdefault(b["learner"], len(learners)), dtype=np.int32)
+        for b in batches
+    ]) if batches else np.zeros(0, dtype=np.int32)
+    return columns
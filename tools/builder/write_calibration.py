@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+보정 난이도 반영
+calibration/difficulty.json의 difficulty를 기존 콘텐츠 파일(core 포함)에 다시 기록
+생성기는 새로 만드는 문항에만 보정값을 적용하므로, 손으로 작성한 문항과
+이번 시드 범위 밖의 생성 문항은 이 단계에서 갱신된다
+문항 객체 안의 "difficulty" 값만 바꾸고 나머지 서식은 그대로 유지
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Tuple
+
+from bank import DEFAULT_CONTENT_DIR, DEFAULT_CALIBRATION_PATH, iter_bank_files, iter_item_spans, load_calibration
+
+DIFFICULTY_RE = re.compile(r'("difficulty"\s*:\s*)-?\d+(?:\.\d+)?')
+
+
+def rewrite_difficulty(text: str, calibration: Dict[str, int]) -> Tuple[str, int, int]:
+    """파일 텍스트의 difficulty를 보정값으로 교체 → (새 텍스트, 교체 수, 건너뛴 수)"""
+    parts, last = [], 0
+    changed, skipped = 0, 0
+
+    for item, start, end in iter_item_spans(text):
+        target = calibration.get(item.get("id"))
+        if target is None or item.get("difficulty") == target:
+            continue
+        span = text[start:end]
+        # 하위 객체에 같은 키가 있으면 어느 쪽인지 서식만으로 가릴 수 없으므로 건너뜀
+        if len(DIFFICULTY_RE.findall(span)) != 1:
+            skipped += 1
+            continue
+        parts.append(text[last:start])
+        parts.append(DIFFICULTY_RE.sub(lambda m: f"{m.group(1)}{target}", span))
+        last = end
+        changed += 1
+
+    parts.append(text[last:])
+    return "".join(parts), changed, skipped
+
+
+def write_calibration(content_dir: Path, calibration: Dict[str, int]) -> Dict[str, Tuple[int, int]]:
+    """콘텐츠 파일별 (교체 수, 건너뛴 수). 바뀐 파일만 다시 기록"""
+    results = {}
+    for path in iter_bank_files(content_dir):
+        text = path.read_text(encoding="utf-8")
+        new_text, changed, skipped = rewrite_difficulty(text, calibration)
+        if changed:
+            path.write_text(new_text, encoding="utf-8")
+        if changed or skipped:
+            results[path.relative_to(content_dir).as_posix()] = (changed, skipped)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="보정 난이도를 기존 콘텐츠 파일에 반영")
+    parser.add_argument("--content", type=str, default=str(DEFAULT_CONTENT_DIR),
+                        help="콘텐츠 루트 디렉토리")
+    parser.add_argument("--calibration", type=str, default=str(DEFAULT_CALIBRATION_PATH),
+                        help="보정 테이블 경로")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("보정 난이도 반영")
+    print("=" * 60)
+
+    calibration = load_calibration(Path(args.calibration))
+    print(f"\n보정 테이블: {len(calibration)}개 문항")
+
+    results = write_calibration(Path(args.content), calibration)
+    for rel, (changed, skipped) in results.items():
+        note = f" (건너뜀 {skipped}개)" if skipped else ""
+        print(f"  {rel}: {changed}개 갱신{note}")
+
+    print(f"\n✅ 반영 완료! 갱신 문항: {sum(c for c, _ in results.values())}개")
@@ -7,8 +7,15 @@ Tatoeba CC0 문장 기반 듣기/읽기/문법 문항 생성
 import json
 import random
 import hashlib
+import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "builder"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "ingest"))
+from bank import load_calibration, apply_calibration
+from tatoeba import DEFAULT_INDEX_DIR, LENGTH_BUCKETS, WORD_RE, SentenceIndex
 
 # 영어 학습 템플릿
 ENGLISH_TEMPLATES = {
@@ -43,6 +50,13 @@ ENGLISH_TEMPLATES = {
 }
 
 
+# 학년군별 코퍼스 버킷 (길이-어휘수준, tools/ingest/tatoeba.py)
+CORPUS_BUCKETS = {
+    "ES56": ["short-1", "short-2"],
+    "MS1": ["short-3", "medium-1", "medium-2"],
+}
+
+
 def generate_problem_id(problem_type: str, seed: int, grade_band: str) -> str:
     """고유 문항 ID 생성"""
     raw = f"E-{grade_band}-{problem_type}-{seed}"
@@ -173,7 +187,85 @@ def generate_grammar_item(seed: int, grade_band: str, template: tuple) -> Dict[s
     }
 
 
-def build_content_bank(seeds_per_type: int = 30, seed_offset: int = 0) -> Dict[str, List[Dict]]:
+def cloze_candidates(sentence: str) -> List[str]:
+    """빈칸으로 뚫을 수 있는 단어 (소문자, 3글자 이상, 축약형 제외)"""
+    return [w for w in WORD_RE.findall(sentence) if w.islower() and len(w) >= 3 and "'" not in w]
+
+
+def corpus_difficulty(bucket: str) -> int:
+    """버킷(short/medium/long × 어휘수준 1..3)을 1..10 난이도로 환산"""
+    length, level = bucket.rsplit("-", 1)
+    length_idx = [name for name, _, _ in LENGTH_BUCKETS].index(length)
+    return min(10, 2 + 2 * length_idx + int(level))
+
+
+def generate_cloze_item(seed: int, grade_band: str, corpus: SentenceIndex) -> Optional[Dict[str, Any]]:
+    """코퍼스 문장 빈칸 문항 생성 (오답은 같은 버킷의 다른 문장 단어)"""
+    rng = random.Random(seed)
+    buckets = CORPUS_BUCKETS[grade_band]
+    if corpus.count(buckets) == 0:
+        return None
+    
+    bucket, sentence_id, sentence = corpus.sample(buckets, rng)
+    # 문장에 대소문자 구분 없이 한 번만 나오는 단어만 정답으로 ("The ... the"처럼 빈칸 밖에 정답이 남지 않도록)
+    all_words = [w.lower() for w in WORD_RE.findall(sentence)]
+    candidates = [w for w in cloze_candidates(sentence) if all_words.count(w) == 1]
+    if not candidates:
+        return None
+    correct = rng.choice(candidates)
+    in_sentence = set(all_words)
+    
+    distractors = []
+    for _ in range(20):
+        if len(distractors) == 3:
+            break
+        _, _, other = corpus.sample(buckets, rng)
+        options = [w for w in cloze_candidates(other) if w not in in_sentence and w not in distractors]
+        if options:
+            distractors.append(rng.choice(options))
+    if len(distractors) < 3:
+        return None
+    
+    # WORD_RE와 같은 단어 경계 ("cat's" 안의 "cat"은 건드리지 않음)
+    stem = re.sub(rf"(?<![A-Za-z']){re.escape(correct)}(?![A-Za-z'])", "___", sentence, count=1)
+    shuffled = [correct] + distractors
+    rng.shuffle(shuffled)
+    
+    choice_objs = [{"id": chr(97+i), "label": c} for i, c in enumerate(shuffled)]
+    correct_id = next(c["id"] for c in choice_objs if c["label"] == correct)
+    
+    return {
+        "id": generate_problem_id("CLOZE", seed, grade_band),
+        "subject": "english",
+        "area": "english.grammar",
+        "gradeBand": [grade_band],
+        "conceptTag": ["cloze", "vocabulary"],
+        "stem": {
+            "type": "text",
+            "payload": stem
+        },
+        "choices": choice_objs,
+        "answer": {
+            "kind": "mcq",
+            "value": correct_id
+        },
+        "source": {
+            "generator": "tatoeba",
+            "sentenceId": sentence_id,
+            "seed": seed,
+            "license": "CC0"
+        },
+        "difficulty": corpus_difficulty(bucket),
+        "variants": [f"seed:{seed}"]
+    }
+
+
+def build_content_bank(
+    seeds_per_type: int = 30,
+    seed_offset: int = 0,
+    corpus: Optional[SentenceIndex] = None,
+    corpus_items: int = 100
+) -> Dict[str, List[Dict]]:
     """전체 영어 문항 생성"""
     content = {"ES56": [], "MS1": []}
     
@@ -200,6 +292,15 @@ def build_content_bank(seeds_per_type: int = 30, seed_offset: int = 0) -> Dict[s
                         generated += 1
             
             print(f"    {category}: {generated}개")
+        
+        if corpus is not None:
+            generated = 0
+            for i in range(corpus_items):
+                item = generate_cloze_item(seed_offset + i, grade_band, corpus)
+                if item:
+                    content[grade_band].append(item)
+                    generated += 1
+            print(f"    코퍼스 빈칸: {generated}개")
     
     return content
 
@@ -207,15 +308,17 @@ def build_content_bank(seeds_per_type: int = 30, seed_offset: int = 0) -> Dict[s
 def export_to_json(content: Dict[str, List[Dict]], output_dir: Path):
     """JSON 파일로 내보내기"""
     output_dir.mkdir(parents=True, exist_ok=True)
+    calibration = load_calibration()
     
     for grade_band, items in content.items():
+        calibrated = apply_calibration(items, calibration)
         filename = f"english.{grade_band.lower()}.generated.json"
         filepath = output_dir / filename
         
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(items, f, ensure_ascii=False, indent=2)
         
-        print(f"\n✓ {filepath} 생성: {len(items)}개 문항")
+        print(f"\n✓ {filepath} 생성: {len(items)}개 문항 (난이도 보정 {calibrated}개)")
 
 
 if __name__ == "__main__":
@@ -227,6 +330,9 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str,
                         default="/home/lchangoo/Workspace/jihoo-rebuild-game/apps/web/content/english",
                         help="출력 디렉토리")
+    parser.add_argument("--corpus-index", type=str, default=None,
+                        help=f"Tatoeba 인덱스 디렉토리 (ingest/tatoeba.py, 예: {DEFAULT_INDEX_DIR})")
+    parser.add_argument("--corpus-items", type=int, default=100, help="학년군당 코퍼스 문항 개수")
     
     args = parser.parse_args()
     
@@ -235,7 +341,17 @@ if __name__ == "__main__":
     print(f"시드 범위: {args.offset} ~ {args.offset + args.seeds}")
     print("=" * 60)
     
-    content_bank = build_content_bank(seeds_per_type=args.seeds, seed_offset=args.offset)
+    corpus = SentenceIndex(Path(args.corpus_index)) if args.corpus_index else None
+    try:
+        content_bank = build_content_bank(
+            seeds_per_type=args.seeds,
+            seed_offset=args.offset,
+            corpus=corpus,
+            corpus_items=args.corpus_items
+        )
+    finally:
+        if corpus is not None:
+            corpus.close()
     
     total = sum(len(items) for items in content_bank.values())
     print(f"\n총 생성: {total}개")
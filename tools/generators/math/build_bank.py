@@ -7,9 +7,13 @@ mathgenerator를 사용하여 초5-6, 중1 수학 문항 대량 생성
 import json
 import random
 import hashlib
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "builder"))
+from bank import load_calibration, apply_calibration
+
 try:
     import mathgenerator
 except ImportError:
@@ -51,7 +55,6 @@ PROBLEM_SETS = {
         ],
         "문자와식": [
             (6, "일차방정식", ["일차방정식"]),
-            (8, "일차함수", ["일차함수"]),
         ],
         "기하": [
             (9, "피타고라스정리", ["피타고라스", "직각삼각형"]),
@@ -169,15 +172,17 @@ def build_content_bank(seeds_per_type: int = 50, seed_offset: int = 0) -> Dict[s
 def export_to_json(content: Dict[str, List[Dict]], output_dir: Path):
     """JSON 파일로 내보내기"""
     output_dir.mkdir(parents=True, exist_ok=True)
+    calibration = load_calibration()
     
     for grade_band, items in content.items():
+        calibrated = apply_calibration(items, calibration)
         filename = f"math.{grade_band.lower()}.generated.json"
         filepath = output_dir / filename
         
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(items, f, ensure_ascii=False, indent=2)
         
-        print(f"\n✓ {filepath} 생성: {len(items)}개 문항")
+        print(f"\n✓ {filepath} 생성: {len(items)}개 문항 (난이도 보정 {calibrated}개)")
 
 
 if __name__ == "__main__":
@@ -7,9 +7,13 @@
 import json
 import random
 import hashlib
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "builder"))
+from bank import load_calibration, apply_calibration
+
 # 사회 템플릿
 SOCIAL_TEMPLATES = {
     "ES": {
@@ -131,15 +135,17 @@ def build_content_bank(seeds_per_type: int = 30, seed_offset: int = 0) -> Dict[s
 def export_to_json(content: Dict[str, List[Dict]], output_dir: Path):
     """JSON 파일로 내보내기"""
     output_dir.mkdir(parents=True, exist_ok=True)
+    calibration = load_calibration()
     
     for grade_band, items in content.items():
+        calibrated = apply_calibration(items, calibration)
         filename = f"social.{grade_band.lower()}.generated.json"
         filepath = output_dir / filename
         
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(items, f, ensure_ascii=False, indent=2)
         
-        print(f"\n✓ {filepath} 생성: {len(items)}개 문항")
+        print(f"\n✓ {filepath} 생성: {len(items)}개 문항 (난이도 보정 {calibrated}개)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Tatoeba 문장 코퍼스 수집
+로컬 sentences TSV 덤프(id \\t lang \\t text)를 청크 단위로 스트리밍하며
+영어 문장을 길이 × 어휘 수준 버킷으로 나눠 디스크 인덱스에 기록
+생성기는 mmap으로 인덱스를 열어 코퍼스를 메모리에 올리지 않고 문장을 표본 추출
+"""
+
+import hashlib
+import json
+import mmap
+import random
+import re
+import struct
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+DEFAULT_INDEX_DIR = Path(__file__).resolve().parent / "tatoeba-index"
+INDEX_VERSION = 2
+
+# 레코드 = 코퍼스 내 줄 시작 바이트 오프셋(uint64) + 줄 길이(uint32)
+RECORD = struct.Struct("<QI")
+CHUNK_SIZE = 16 * 1024 * 1024
+
+# (이름, 최소 단어 수, 최대 단어 수)
+LENGTH_BUCKETS = [("short", 4, 7), ("medium", 8, 12), ("long", 13, 20)]
+VOCAB_LEVELS = [1, 2, 3]
+
+WORD_RE = re.compile(r"[A-Za-z']+")
+# 영어 문장만 (따옴표/괄호/숫자가 섞인 문장은 문항으로 쓰기 어려워 제외)
+SENTENCE_RE = re.compile(r"^[A-Z][A-Za-z' ,]*[.?!]$")
+
+
+def load_vocab(path: Optional[Path]) -> Dict[str, int]:
+    """'word \\t level' 형식의 어휘 목록 로드 (없으면 빈 dict)"""
+    vocab = {}
+    if path is None:
+        return vocab
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) >= 2 and parts[1].isdigit():
+                vocab[parts[0].lower()] = int(parts[1])
+    return vocab
+
+
+def vocab_level(words: List[str], vocab: Dict[str, int]) -> int:
+    """
+    문장의 어휘 수준 (1..3)
+    어휘 목록이 있으면 가장 어려운 단어의 수준 (목록에 없는 단어는 3),
+    없으면 가장 긴 단어 길이로 근사
+    """
+    if vocab:
+        return min(3, max(vocab.get(w.lower(), 3) for w in words))
+    longest = max(len(w) for w in words)
+    return 1 if longest <= 5 else 2 if longest <= 7 else 3
+
+
+def bucket_name(length: str, level: int) -> str:
+    return f"{length}-{level}"
+
+
+def classify(text: str, vocab: Dict[str, int]) -> Optional[str]:
+    """문장을 버킷 이름으로 분류, 대상이 아니면 None"""
+    if not SENTENCE_RE.match(text):
+        return None
+    words = WORD_RE.findall(text)
+    for name, low, high in LENGTH_BUCKETS:
+        if low <= len(words) <= high:
+            return bucket_name(name, vocab_level(words, vocab))
+    return None
+
+
+def corpus_signature(corpus: Path) -> Dict[str, object]:
+    """코퍼스 파일 서명: 경로/크기/수정시각 (레코드의 바이트 오프셋이 유효한지 판단)"""
+    stat = corpus.stat()
+    return {"corpus": str(corpus.resolve()), "size": stat.st_size, "mtime": int(stat.st_mtime)}
+
+
+def index_signature(corpus: Path, lang: str, vocab_path: Optional[Path]) -> Dict[str, object]:
+    """인덱스 입력 서명: 코퍼스 서명 + 언어 + 어휘 목록 sha256 (없으면 None)"""
+    vocab_hash = hashlib.sha256(vocab_path.read_bytes()).hexdigest() if vocab_path else None
+    return {**corpus_signature(corpus), "lang": lang, "vocab": vocab_hash}
+
+
+def matches_manifest(manifest: Dict[str, object], signature: Dict[str, object]) -> bool:
+    return manifest.get("version") == INDEX_VERSION and all(
+        manifest.get(key) == value for key, value in signature.items()
+    )
+
+
+def is_index_current(
+    corpus: Path,
+    index_dir: Path,
+    lang: str = "eng",
+    vocab_path: Optional[Path] = None
+) -> bool:
+    """같은 코퍼스/언어/어휘 목록으로 만든 인덱스가 이미 있으면 True"""
+    manifest_path = index_dir / "manifest.json"
+    if not manifest_path.exists():
+        return False
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    return matches_manifest(manifest, index_signature(corpus, lang, vocab_path))
+
+
+def build_index(
+    corpus: Path,
+    index_dir: Path,
+    lang: str = "eng",
+    vocab_path: Optional[Path] = None
+) -> Dict[str, object]:
+    """코퍼스를 CHUNK_SIZE씩 읽어 버킷별 레코드 파일과 manifest.json 작성"""
+    vocab = load_vocab(vocab_path)
+    lang_field = lang.encode("utf-8")
+    index_dir.mkdir(parents=True, exist_ok=True)
+
+    names = [bucket_name(n, lv) for n, _, _ in LENGTH_BUCKETS for lv in VOCAB_LEVELS]
+    writers = {name: open(index_dir / f"{name}.bin", "wb") for name in names}
+    counts = {name: 0 for name in names}
+    lines = 0
+
+    try:
+        with open(corpus, "rb") as f:
+            offset, carry = 0, b""
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk and not carry:
+                    break
+                data = carry + chunk
+                parts = data.split(b"\n")
+                # 마지막 조각은 줄이 끝나지 않았을 수 있으므로 다음 청크로 넘김
+                carry = parts.pop() if chunk else b""
+
+                for line in parts:
+                    start = offset
+                    offset += len(line) + 1
+                    lines += 1
+                    fields = line.split(b"\t")
+                    if len(fields) < 3 or fields[1] != lang_field:
+                        continue
+                    text = fields[2].decode("utf-8", errors="replace").strip()
+                    name = classify(text, vocab)
+                    if name:
+                        writers[name].write(RECORD.pack(start, len(line)))
+                        counts[name] += 1
+    finally:
+        for w in writers.values():
+            w.close()
+
+    manifest = {
+        "version": INDEX_VERSION,
+        **index_signature(corpus, lang, vocab_path),
+        "lines": lines,
+        "buckets": counts,
+    }
+    with open(index_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+class SentenceIndex:
+    """버킷 레코드와 코퍼스를 mmap으로 열어 상수 메모리로 문장을 표본 추출"""
+
+    def __init__(self, index_dir: Path = DEFAULT_INDEX_DIR):
+        with open(index_dir / "manifest.json", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        # 인덱스 이후 덤프가 바뀌었으면 레코드의 바이트 오프셋이 엉뚱한 곳을 가리킴
+        corpus = Path(self.manifest["corpus"])
+        if not corpus.exists() or not matches_manifest(self.manifest, corpus_signature(corpus)):
+            raise ValueError(f"{index_dir} 인덱스가 {corpus}와 맞지 않습니다 (tatoeba.py로 다시 인덱싱)")
+        self._files = []
+        self.corpus = self._open(corpus)
+        self.buckets = {
+            name: self._open(index_dir / f"{name}.bin")
+            for name, count in self.manifest["buckets"].items() if count
+        }
+
+    def _open(self, path: Path) -> mmap.mmap:
+        f = open(path, "rb")
+        self._files.append(f)
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        for m in [self.corpus, *self.buckets.values()]:
+            m.close()
+        for f in self._files:
+            f.close()
+
+    def __enter__(self) -> "SentenceIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def count(self, names: List[str]) -> int:
+        return sum(self.manifest["buckets"].get(n, 0) for n in names)
+
+    def sample(self, names: List[str], rng: random.Random) -> Tuple[str, str, str]:
+        """버킷 목록 전체에서 균등하게 문장 하나 추출 → (버킷 이름, 문장 id, 문장)"""
+        k = rng.randrange(self.count(names))
+        for name in names:
+            size = self.manifest["buckets"].get(name, 0)
+            if k < size:
+                start, length = RECORD.unpack_from(self.buckets[name], k * RECORD.size)
+                fields = self.corpus[start:start + length].decode("utf-8", errors="replace").split("\t")
+                return name, fields[0], fields[2].strip()
+            k -= size
+        raise IndexError("빈 버킷")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tatoeba 문장 코퍼스 인덱싱")
+    parser.add_argument("corpus", type=str, help="sentences TSV 덤프 경로 (id\\tlang\\ttext)")
+    parser.add_argument("--index", type=str, default=str(DEFAULT_INDEX_DIR),
+                        help="인덱스 출력 디렉토리")
+    parser.add_argument("--lang", type=str, default="eng", help="언어 코드")
+    parser.add_argument("--vocab", type=str, default=None,
+                        help="어휘 수준 목록 (word\\tlevel, 1..3)")
+    parser.add_argument("--force", action="store_true", help="인덱스가 최신이어도 다시 생성")
+
+    args = parser.parse_args()
+    corpus_path, index_path = Path(args.corpus), Path(args.index)
+    vocab_path = Path(args.vocab) if args.vocab else None
+
+    print("=" * 60)
+    print("Tatoeba 코퍼스 인덱싱")
+    print("=" * 60)
+
+    if not args.force and is_index_current(corpus_path, index_path, args.lang, vocab_path):
+        print(f"\n✓ {index_path} 최신 상태 (재인덱싱 생략)")
+    else:
+        manifest = build_index(corpus_path, index_path, lang=args.lang, vocab_path=vocab_path)
+        print(f"\n처리한 줄: {manifest['lines']}개")
+        for name, count in manifest["buckets"].items():
+            print(f"  {name}: {count}개")
+        print(f"\n✓ {index_path} 생성")
+
+    print("\n✅ 인덱싱 완료!")